@@ -233,7 +233,8 @@ async def run_batch_job(job: BatchJob):
         # Small delay to allow WebSocket updates
         await asyncio.sleep(0.01)
     
-    # Finalize
+    # Finalize (wait for files queued by save plugins to hit the disk)
+    job.pipeline.flush()
     job.end_time = time.time()
     job.status = "completed" if job.failed == 0 else "failed" if job.processed == 0 else "completed"
     
@@ -0,0 +1,207 @@
+"""
+Background Image Writer
+Encodes and writes images to disk off the pipeline thread.
+"""
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Sequence
+
+import numpy as np
+import cv2
+
+
+# Shared by all save plugins; OpenCV releases the GIL while encoding/writing
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-writer")
+
+# Writes queued or running at once; submit() blocks at the limit so queued
+# images (each holding a full frame) cannot pile up faster than disk drains
+MAX_PENDING_WRITES = 16
+_write_slots = threading.BoundedSemaphore(MAX_PENDING_WRITES)
+
+
+# zlib level per "compression" option. "fast" has none: with no params
+# OpenCV 4.x already uses level 1 with the SUB filter and RLE strategy,
+# which beats any explicit level on speed (and usually on size)
+PNG_COMPRESSION_LEVELS = {
+    "balanced": 3,
+    "smallest": 9,
+}
+
+# Encoder params, built once
+_PNG_PARAMS = {
+    name: [cv2.IMWRITE_PNG_COMPRESSION, level]
+    for name, level in PNG_COMPRESSION_LEVELS.items()
+}
+_PNG_PARAMS["fast"] = []
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 95, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+# Quality above 100 selects lossless WebP, which is what OpenCV writes by default
+_WEBP_PARAMS = [cv2.IMWRITE_WEBP_QUALITY, 101]
+
+
+def encode_params(file_format: str, compression: str = "fast") -> list[int]:
+    """Return the cv2.imwrite params for a file format ("png", "jpg", "webp")."""
+    if file_format == "png":
+        return _PNG_PARAMS.get(compression, _PNG_PARAMS["fast"])
+    if file_format == "jpg":
+        return _JPEG_PARAMS
+    if file_format == "webp":
+        return _WEBP_PARAMS
+    return []
+
+
+# Output path string -> resolved directory that has already been created
+_DIR_CACHE: Dict[str, Path] = {}
+
+# Directory -> stamp taken the last time it was forgotten, so callers caching
+# its contents can tell it was re-created (next() on a count is atomic)
+_DIR_GENERATIONS: Dict[Path, int] = {}
+_generation_counter = itertools.count(1)
+
+
+def resolve_output_dir(output_path_str: str) -> Path:
+    """
+    Resolve and create a save plugin's output directory.
+    Successful results are cached per path string, so repeated saves to the
+    same folder skip the resolve() walk and mkdir(). Falls back to ./output
+    (uncached) if the directory cannot be created.
+    """
+    output_dir = _DIR_CACHE.get(output_path_str)
+    if output_dir is not None:
+        return output_dir
+    
+    base_output_dir = Path("./output").resolve()
+    
+    try:
+        # Allow user to specify a path, but it must be within the allowed areas
+        target_dir = Path(output_path_str).resolve()
+        
+        # Simple sanitization: Create a confined output directory if not absolute
+        if not target_dir.is_absolute():
+            target_dir = (base_output_dir / output_path_str).resolve()
+        
+        target_dir.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        print(f"Error creating directory {output_path_str}: {e}")
+        base_output_dir.mkdir(parents=True, exist_ok=True)
+        return base_output_dir
+    
+    _DIR_CACHE[output_path_str] = target_dir
+    return target_dir
+
+
+def forget_output_dir(output_dir: Path) -> None:
+    """
+    Drop every cached path string that resolved to output_dir, so the next
+    resolve_output_dir() re-creates it (e.g. after it was deleted).
+    """
+    for key, cached_dir in list(_DIR_CACHE.items()):
+        if cached_dir == output_dir:
+            _DIR_CACHE.pop(key, None)
+    _DIR_GENERATIONS[output_dir] = next(_generation_counter)
+
+
+def output_dir_generation(output_dir: Path) -> int:
+    """Stamp that changes each time output_dir is forgotten (0 if never)."""
+    return _DIR_GENERATIONS.get(output_dir, 0)
+
+
+def _write_image(path: Path, image: np.ndarray, params: list[int]) -> bool:
+    """cv2.imwrite, re-creating the directory once if it vanished after being resolved."""
+    if cv2.imwrite(str(path), image, params):
+        return True
+    if path.parent.exists():
+        return False
+    forget_output_dir(path.parent)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return cv2.imwrite(str(path), image, params)
+
+
+def prepare_for_imwrite(image: np.ndarray, color_order: str = "rgb") -> np.ndarray:
+    """
+    Convert an image to the 8-bit BGR(A-less) layout cv2.imwrite expects.
+    
+    Args:
+        image: Image in any supported bit depth (uint8, uint16, float 0-1)
+        color_order: "rgb" (the internal convention) or "bgr" if the data is
+            already in OpenCV order, which skips the channel swap
+    
+    Returns:
+        The input itself when no conversion is needed, otherwise a new array
+        (the input is never modified)
+    """
+    save_image = image
+    
+    # Ensure it's 8-bit for saving with imwrite
+    if save_image.dtype != np.uint8:
+        if save_image.dtype == np.uint16:
+            # Integer shift, same truncation as / 256 without the float64 temporary
+            save_image = (save_image >> 8).astype(np.uint8)
+        elif save_image.dtype in [np.float32, np.float64]:
+            # Saturating scale+cast in one OpenCV pass; clamp negatives first
+            # since convertScaleAbs takes the absolute value
+            save_image = cv2.convertScaleAbs(cv2.max(save_image, 0.0), alpha=255.0)
+    
+    # Convert RGB to BGR for OpenCV imwrite
+    if len(save_image.shape) == 3:
+        if save_image.shape[2] == 3:
+            if color_order == "rgb":
+                save_image = cv2.cvtColor(save_image, cv2.COLOR_RGB2BGR)
+        elif save_image.shape[2] == 4:
+            if color_order == "rgb":
+                save_image = cv2.cvtColor(save_image, cv2.COLOR_RGBA2BGR)
+            else:
+                save_image = cv2.cvtColor(save_image, cv2.COLOR_BGRA2BGR)
+    
+    return save_image
+
+
+class PendingWrites:
+    """
+    Tracks the background writes submitted by one plugin instance.
+
+    Paths stay tracked until their write finishes, so collision checks can
+    treat a queued file as already existing.
+    """
+
+    def __init__(self):
+        self._futures: Dict[Path, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, path: Path, image: np.ndarray, params: Sequence[int] = ()) -> None:
+        """
+        Queue cv2.imwrite(path, image, params). The image must not be modified
+        afterwards. Blocks while MAX_PENDING_WRITES writes are in flight.
+        """
+        _write_slots.acquire()
+        try:
+            with self._lock:
+                future = _executor.submit(_write_image, path, image, list(params))
+                self._futures[path] = future
+        except BaseException:
+            _write_slots.release()
+            raise
+        future.add_done_callback(lambda f: self._on_done(path, f))
+
+    def __contains__(self, path: Path) -> bool:
+        with self._lock:
+            return path in self._futures
+
+    def flush(self) -> None:
+        """Block until every write submitted so far has finished."""
+        with self._lock:
+            futures = list(self._futures.values())
+        wait(futures)
+
+    def _on_done(self, path: Path, future: Future) -> None:
+        _write_slots.release()
+        with self._lock:
+            if self._futures.get(path) is future:
+                del self._futures[path]
+
+        error = future.exception()
+        if error is not None:
+            print(f"Error writing image {path}: {error}")
+        elif not future.result():
+            print(f"Error writing image {path}: cv2.imwrite failed")
@@ -0,0 +1,18 @@
+"""
+JIT Compilation
+Optional Numba acceleration for fused per-pixel kernels.
+"""
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    # Kernels can still be defined (and run as plain Python); callers check
+    # HAVE_NUMBA and use their NumPy/OpenCV path instead
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,42 @@
+"""
+OpenCL Acceleration
+Optional GPU offload through OpenCV's Transparent API (cv2.UMat).
+"""
+import os
+from typing import Callable, Union
+
+import numpy as np
+import cv2
+
+
+# Enabled when OpenCV sees a usable OpenCL device; set NEUROPIXEL_UMAT=0 to force CPU
+# (NEUROPIXEL_USE_UMAT is accepted as an alias and takes precedence)
+USE_UMAT = cv2.ocl.haveOpenCL() and os.environ.get(
+    "NEUROPIXEL_USE_UMAT", os.environ.get("NEUROPIXEL_UMAT", "1")
+) == "1"
+
+
+def run_with_umat(
+    op: Callable[[Union[np.ndarray, cv2.UMat]], Union[np.ndarray, cv2.UMat]],
+    image: np.ndarray,
+) -> np.ndarray:
+    """
+    Run an OpenCV operation (or chain of operations) on the GPU when available.
+
+    Args:
+        op: Callable taking the image and returning the result. It must only
+            use OpenCV functions so it works with both ndarray and UMat input.
+        image: Input image as numpy array
+
+    Returns:
+        Result as numpy array. Falls back to running op on the CPU array if
+        OpenCL is disabled or the OpenCL path raises.
+    """
+    if USE_UMAT:
+        try:
+            result = op(cv2.UMat(image))
+            return result.get() if isinstance(result, cv2.UMat) else result
+        except cv2.error:
+            pass
+
+    return op(image)
@@ -99,6 +99,16 @@ class Pipeline:
             errors=errors
         )
     
+    def flush(self) -> None:
+        """
+        Wait for background work (e.g. queued file writes) started by the
+        pipeline's plugins. Call once after the last execute().
+        """
+        for step in self.steps:
+            plugin = plugin_manager.get_plugin(step.plugin_name)
+            if plugin is not None:
+                plugin.flush()
+    
     def validate(self) -> tuple[bool, List[str]]:
         """
         Validate that all plugins in the pipeline exist.
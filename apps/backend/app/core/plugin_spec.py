@@ -111,6 +111,10 @@ class PluginSpec(BaseModel):
 # Plugin Base Class
 # =============================================================================
 
+# Validated parameter sets remembered per plugin instance
+PARAM_CACHE_SIZE = 4
+
+
 class ImagePlugin(ABC):
     """
     Abstract base class for all image processing plugins.
@@ -123,6 +127,10 @@ class ImagePlugin(ABC):
     # Must be overridden by subclasses
     SPEC: PluginSpec
     
+    def __init__(self):
+        # kwargs key -> validated params, see validate_params()
+        self._param_cache: dict[tuple, dict[str, Any]] = {}
+    
     @abstractmethod
     def run(self, image: np.ndarray, **kwargs) -> np.ndarray:
         """
@@ -134,6 +142,18 @@ class ImagePlugin(ABC):
             
         Returns:
             Processed image as numpy array (same format as input where possible)
+
+        Notes:
+            run() may be called from worker threads (e.g. concurrent pipeline
+            nodes). Implementations must not modify the input image in place
+            or mutate shared state outside the OpenCV/NumPy calls.
+        """
+        pass
+    
+    def flush(self) -> None:
+        """
+        Wait for any background work started by run() (e.g. queued file writes).
+        Called at pipeline teardown; the default implementation does nothing.
         """
         pass
     
@@ -141,7 +161,25 @@ class ImagePlugin(ABC):
         """
         Validate and fill in default values for parameters.
         Returns a dict with all parameters (using defaults where not provided).
+        
+        The last few results are memoized per instance, so repeated calls with
+        identical kwargs (e.g. a slider held still) skip the SPEC walk.
+        Subclasses defining __init__ must call super().__init__().
         """
+        # Types are part of the key: 1, 1.0 and True are equal and hash alike,
+        # but a cached result must hand back the value type the caller passed
+        try:
+            key = tuple(sorted((k, type(v), v) for k, v in kwargs.items()))
+            hash(key)
+        except TypeError:
+            key = None  # Unhashable values; validate without caching
+        
+        cache = self._param_cache
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return dict(cached)
+        
         validated = {}
         
         for param in self.SPEC.params:
@@ -157,8 +195,13 @@ class ImagePlugin(ABC):
                 validated[high_key] = kwargs.get(high_key, param.default_high)
             else:
                 validated[name] = param.default
-                
-        return validated
+        
+        if key is not None:
+            if len(cache) >= PARAM_CACHE_SIZE:
+                cache.clear()
+            cache[key] = validated
+        
+        return dict(validated)
 
 
 # =============================================================================
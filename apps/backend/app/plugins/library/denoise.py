@@ -5,6 +5,7 @@ Reduce image noise using various methods.
 import numpy as np
 import cv2
 
+from app.core.opencl import run_with_umat
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
@@ -68,35 +69,45 @@ class DenoisePlugin(ImagePlugin):
         if strength == 0:
             return image
         
+        # All methods have OpenCL implementations, used via UMat when available
         if method == "nlmeans":
             if len(image.shape) == 2:
                 # Grayscale
-                return cv2.fastNlMeansDenoising(
-                    image, 
-                    None, 
-                    h=strength,
-                    templateWindowSize=7,
-                    searchWindowSize=21
+                return run_with_umat(
+                    lambda img: cv2.fastNlMeansDenoising(
+                        img, 
+                        None, 
+                        h=strength,
+                        templateWindowSize=7,
+                        searchWindowSize=21
+                    ),
+                    image,
                 )
             else:
                 # Color
-                return cv2.fastNlMeansDenoisingColored(
+                return run_with_umat(
+                    lambda img: cv2.fastNlMeansDenoisingColored(
+                        img,
+                        None,
+                        h=strength,
+                        hColor=color_strength,
+                        templateWindowSize=7,
+                        searchWindowSize=21
+                    ),
                     image,
-                    None,
-                    h=strength,
-                    hColor=color_strength,
-                    templateWindowSize=7,
-                    searchWindowSize=21
                 )
                 
         elif method == "bilateral":
             d = int(strength / 5) * 2 + 1  # Diameter
-            return cv2.bilateralFilter(image, d, strength * 2, strength * 2)
+            return run_with_umat(
+                lambda img: cv2.bilateralFilter(img, d, strength * 2, strength * 2),
+                image,
+            )
             
         elif method == "median":
             ksize = int(strength / 10) * 2 + 1
             ksize = max(3, min(ksize, 31))  # Clamp to valid range
-            return cv2.medianBlur(image, ksize)
+            return run_with_umat(lambda img: cv2.medianBlur(img, ksize), image)
         
         return image
 
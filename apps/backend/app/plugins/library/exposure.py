@@ -41,6 +41,10 @@ SPEC = PluginSpec(
 )
 
 
+# The 256 uint8 levels normalized to 0-1, for building the LUT
+_LUT_X_N01 = np.arange(256, dtype=np.float32) / 255.0
+
+
 class ExposurePlugin(ImagePlugin):
     """Exposure adjustment using gamma correction."""
     
@@ -55,18 +59,26 @@ class ExposurePlugin(ImagePlugin):
         # Convert exposure stops to multiplier (2^EV)
         exposure_mult = np.power(2.0, exposure)
         
+        # Inverse gamma for natural look
+        inv_gamma = 1.0 / gamma
+        
+        if image.dtype == np.uint8:
+            # Per-value curve: evaluate it once on all 256 levels, apply via cv2.LUT
+            levels = np.power(np.clip(_LUT_X_N01 * exposure_mult, 0, 1), inv_gamma)
+            lut = np.clip(levels * 255.0, 0, 255).astype(np.uint8)
+            return cv2.LUT(image, lut)
+        
         # Normalize to 0-1 range
         img_float = image.astype(np.float32) / 255.0
         
         # Apply exposure
         img_float = img_float * exposure_mult
         
-        # Apply gamma correction (inverse gamma for natural look)
-        inv_gamma = 1.0 / gamma
+        # Apply gamma correction
         img_float = np.power(np.clip(img_float, 0, 1), inv_gamma)
         
-        # Convert back to 0-255
-        return np.clip(img_float * 255.0, 0, 255).astype(np.uint8)
+        # Convert back to 0-255 (scale, saturate and cast in one pass)
+        return cv2.convertScaleAbs(img_float, alpha=255.0)
 
 
 plugin = ExposurePlugin()
@@ -5,6 +5,7 @@ Applies Gaussian smoothing to reduce noise.
 import numpy as np
 import cv2
 
+from app.core.opencl import run_with_umat
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
@@ -57,15 +58,16 @@ class GaussianBlurPlugin(ImagePlugin):
         if kernel_size % 2 == 0:
             kernel_size += 1
         
-        # Apply Gaussian blur
-        blurred = cv2.GaussianBlur(
+        # Apply Gaussian blur (on the GPU via OpenCL when available)
+        return run_with_umat(
+            lambda img: cv2.GaussianBlur(
+                img,
+                (kernel_size, kernel_size),
+                sigmaX=sigma,
+                sigmaY=sigma
+            ),
             image,
-            (kernel_size, kernel_size),
-            sigmaX=sigma,
-            sigmaY=sigma
         )
-        
-        return blurred
 
 
 plugin = GaussianBlurPlugin()
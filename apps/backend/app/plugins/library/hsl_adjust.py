@@ -2,6 +2,8 @@
 HSL Color Adjustment Plugin
 Adjust Hue, Saturation, and Lightness.
 """
+import functools
+
 import numpy as np
 import cv2
 
@@ -50,6 +52,26 @@ SPEC = PluginSpec(
 )
 
 
+@functools.lru_cache(maxsize=128)
+def _hsl_luts(hue_shift: float, sat_shift: float, light_shift: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the uint8 lookup tables for the H, L and S planes of a uint8 HLS image.
+    Each plane adjustment depends only on that plane's value, so a 256-entry
+    table per plane reproduces the float arithmetic exactly.
+    Cached per parameter tuple (callers must not modify the tables).
+    """
+    x = np.arange(256, dtype=np.float32)
+    
+    # Hue (H channel is 0-180 in OpenCV)
+    h_lut = ((x + hue_shift / 2) % 180).astype(np.uint8)
+    # Lightness, scaled to 0-255
+    l_lut = np.clip(x + light_shift * 1.275, 0, 255).astype(np.uint8)
+    # Saturation
+    s_lut = np.clip(x * (1 + sat_shift / 100), 0, 255).astype(np.uint8)
+    
+    return h_lut, l_lut, s_lut
+
+
 class HSLAdjustPlugin(ImagePlugin):
     """HSL color adjustment."""
     
@@ -66,12 +88,30 @@ class HSLAdjustPlugin(ImagePlugin):
         if len(image.shape) == 2:
             # For grayscale, only lightness applies
             if light_shift != 0:
+                if image.dtype == np.uint8:
+                    # Saturating uint8 add/subtract, no float temporary
+                    delta = int(round(light_shift * 2.55))  # Scale to 0-255
+                    if delta >= 0:
+                        return cv2.add(image, delta)
+                    return cv2.subtract(image, -delta)
                 img_float = image.astype(np.float32)
                 img_float = img_float + light_shift * 2.55  # Scale to 0-255
                 return np.clip(img_float, 0, 255).astype(np.uint8)
             return image
         
         # Convert to HLS (OpenCV uses HLS not HSL)
+        if image.dtype == np.uint8:
+            # One cv2.LUT pass per plane, no float cast
+            h_lut, l_lut, s_lut = _hsl_luts(hue_shift, sat_shift, light_shift)
+            h, l, s = cv2.split(cv2.cvtColor(image, cv2.COLOR_BGR2HLS))
+            if hue_shift != 0:
+                h = cv2.LUT(h, h_lut)
+            if light_shift != 0:
+                l = cv2.LUT(l, l_lut)
+            if sat_shift != 0:
+                s = cv2.LUT(s, s_lut)
+            return cv2.cvtColor(cv2.merge((h, l, s)), cv2.COLOR_HLS2BGR)
+        
         hls = cv2.cvtColor(image, cv2.COLOR_BGR2HLS).astype(np.float32)
         
         # Adjust Hue (H channel is 0-180 in OpenCV)
@@ -2,10 +2,12 @@
 Morphological Operations Plugin
 Dilation, Erosion, Opening, Closing operations.
 """
+import functools
+
 import numpy as np
 import cv2
-from skimage import color, img_as_ubyte
 
+from app.core.opencl import run_with_umat
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
@@ -70,6 +72,30 @@ SPEC = PluginSpec(
 )
 
 
+SHAPE_MAP = {
+    "rect": cv2.MORPH_RECT,
+    "ellipse": cv2.MORPH_ELLIPSE,
+    "cross": cv2.MORPH_CROSS,
+}
+
+
+OPERATION_MAP = {
+    "erode": cv2.MORPH_ERODE,
+    "dilate": cv2.MORPH_DILATE,
+    "open": cv2.MORPH_OPEN,
+    "close": cv2.MORPH_CLOSE,
+    "gradient": cv2.MORPH_GRADIENT,
+    "tophat": cv2.MORPH_TOPHAT,
+    "blackhat": cv2.MORPH_BLACKHAT,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _get_structuring_element(shape: int, size: int) -> np.ndarray:
+    """Cached cv2.getStructuringElement (callers must not modify the result)."""
+    return cv2.getStructuringElement(shape, (size, size))
+
+
 class MorphologyPlugin(ImagePlugin):
     """Morphological operations using OpenCV."""
     
@@ -88,39 +114,18 @@ class MorphologyPlugin(ImagePlugin):
             kernel_size += 1
         
         # Create structuring element
-        shape_map = {
-            "rect": cv2.MORPH_RECT,
-            "ellipse": cv2.MORPH_ELLIPSE,
-            "cross": cv2.MORPH_CROSS,
-        }
-        cv_shape = shape_map.get(kernel_shape, cv2.MORPH_RECT)
-        kernel = cv2.getStructuringElement(cv_shape, (kernel_size, kernel_size))
-        
-        # Convert to grayscale if needed for better results
-        if len(image.shape) == 3:
-            process_img = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-            was_color = True
-        else:
-            process_img = image
-            was_color = False
+        cv_shape = SHAPE_MAP.get(kernel_shape, cv2.MORPH_RECT)
+        kernel = _get_structuring_element(cv_shape, kernel_size)
         
         # Map operation to OpenCV function
-        op_map = {
-            "erode": cv2.MORPH_ERODE,
-            "dilate": cv2.MORPH_DILATE,
-            "open": cv2.MORPH_OPEN,
-            "close": cv2.MORPH_CLOSE,
-            "gradient": cv2.MORPH_GRADIENT,
-            "tophat": cv2.MORPH_TOPHAT,
-            "blackhat": cv2.MORPH_BLACKHAT,
-        }
-        cv_op = op_map.get(operation, cv2.MORPH_DILATE)
-        
-        # Apply morphological operation
-        result = cv2.morphologyEx(process_img, cv_op, kernel, iterations=iterations)
+        cv_op = OPERATION_MAP.get(operation, cv2.MORPH_DILATE)
         
-        # Return as 3-channel
-        return np.stack([result, result, result], axis=-1)
+        # Apply morphological operation (per channel on color input, which
+        # morphologyEx supports natively, so color is preserved)
+        return run_with_umat(
+            lambda img: cv2.morphologyEx(img, cv_op, kernel, iterations=iterations),
+            image,
+        )
 
 
 plugin = MorphologyPlugin()
@@ -4,7 +4,6 @@ Automatic thresholding using Otsu's method for binarization.
 """
 import numpy as np
 import cv2
-from skimage import color, img_as_ubyte
 
 from app.core.plugin_spec import (
     ImagePlugin,
@@ -65,9 +64,13 @@ class OtsuThresholdPlugin(ImagePlugin):
         else:
             gray = image
         
-        # Ensure 8-bit
-        if gray.dtype != np.uint8:
-            gray = img_as_ubyte(gray)
+        # Ensure 8-bit (convertScaleAbs scales + saturates in one SIMD pass)
+        if gray.dtype == np.uint16:
+            gray = cv2.convertScaleAbs(gray, alpha=255.0 / 65535.0)
+        elif gray.dtype != np.uint8:
+            # Float images are expected in the 0-1 range; clamp negatives
+            # first since convertScaleAbs takes the absolute value
+            gray = cv2.convertScaleAbs(cv2.max(gray, 0.0), alpha=255.0)
         
         # Map method to OpenCV constant
         method_map = {
@@ -2,6 +2,8 @@
 Rotate & Flip Plugin
 Rotate and flip images.
 """
+import functools
+
 import numpy as np
 import cv2
 
@@ -64,6 +66,46 @@ SPEC = PluginSpec(
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _compute_warp(angle: float, w: int, h: int, expand: bool) -> tuple[tuple[float, ...], int, int]:
+    """
+    Compute the warp for a custom-angle rotation, cached so batches rotating
+    many same-sized images by the same angle only do the setup once.
+    
+    Returns:
+        Tuple of (inverse affine matrix as a flat 6-tuple, new_w, new_h).
+        The matrix is pre-inverted for use with cv2.WARP_INVERSE_MAP.
+    """
+    center = (w / 2, h / 2)
+    
+    # Get rotation matrix
+    rot_mat = cv2.getRotationMatrix2D(center, -angle, 1.0)
+    
+    if expand:
+        # Calculate new image bounds
+        cos = np.abs(rot_mat[0, 0])
+        sin = np.abs(rot_mat[0, 1])
+        new_w = int(h * sin + w * cos)
+        new_h = int(h * cos + w * sin)
+        
+        # Adjust rotation matrix for new center
+        rot_mat[0, 2] += (new_w - w) / 2
+        rot_mat[1, 2] += (new_h - h) / 2
+    else:
+        new_w, new_h = w, h
+    
+    inv_mat = cv2.invertAffineTransform(rot_mat)
+    return tuple(inv_mat.ravel().tolist()), new_w, new_h
+
+
+# (flip_horizontal, flip_vertical) -> cv2.flip code
+FLIP_CODES = {
+    (True, False): 1,
+    (False, True): 0,
+    (True, True): -1,
+}
+
+
 class RotateFlipPlugin(ImagePlugin):
     """Rotate and flip images."""
     
@@ -78,7 +120,9 @@ class RotateFlipPlugin(ImagePlugin):
         flip_v = params.get("flip_vertical", False)
         expand = params.get("expand", True)
         
-        result = image.copy()
+        # Every transform below allocates its own output, so no upfront copy;
+        # with no transform selected the input is returned as-is
+        result = image
         
         # Apply quick rotation if selected
         if quick_rotate == "90":
@@ -86,35 +130,25 @@ class RotateFlipPlugin(ImagePlugin):
         elif quick_rotate == "-90":
             result = cv2.rotate(result, cv2.ROTATE_90_COUNTERCLOCKWISE)
         elif quick_rotate == "180":
-            result = cv2.rotate(result, cv2.ROTATE_180)
+            # A 180 degree turn is a flip on both axes; fold it into the flips
+            flip_h = not flip_h
+            flip_v = not flip_v
         elif angle != 0:
-            # Custom angle rotation
+            # Custom angle rotation. warpAffine already generates source
+            # coordinates in fixed point per block; cached cv2.remap tables
+            # were no faster and would hold 6 bytes per output pixel
             h, w = result.shape[:2]
-            center = (w / 2, h / 2)
-            
-            # Get rotation matrix
-            rot_mat = cv2.getRotationMatrix2D(center, -angle, 1.0)
-            
-            if expand:
-                # Calculate new image bounds
-                cos = np.abs(rot_mat[0, 0])
-                sin = np.abs(rot_mat[0, 1])
-                new_w = int(h * sin + w * cos)
-                new_h = int(h * cos + w * sin)
-                
-                # Adjust rotation matrix for new center
-                rot_mat[0, 2] += (new_w - w) / 2
-                rot_mat[1, 2] += (new_h - h) / 2
-                
-                result = cv2.warpAffine(result, rot_mat, (new_w, new_h))
-            else:
-                result = cv2.warpAffine(result, rot_mat, (w, h))
+            inv_mat, new_w, new_h = _compute_warp(angle, w, h, expand)
+            result = cv2.warpAffine(
+                result,
+                np.array(inv_mat, dtype=np.float64).reshape(2, 3),
+                (new_w, new_h),
+                flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+            )
         
-        # Apply flips
-        if flip_h:
-            result = cv2.flip(result, 1)
-        if flip_v:
-            result = cv2.flip(result, 0)
+        # Apply flips as a single pass (cv2.flip code -1 flips both axes)
+        if flip_h or flip_v:
+            result = cv2.flip(result, FLIP_CODES[(flip_h, flip_v)])
         
         return result
 
@@ -41,6 +41,10 @@ SPEC = PluginSpec(
 )
 
 
+# Input levels for the 256-entry saturation LUT
+_LUT_X = np.arange(256, dtype=np.float32)
+
+
 class SaturationPlugin(ImagePlugin):
     """Saturation adjustment in HSV color space."""
     
@@ -56,25 +60,43 @@ class SaturationPlugin(ImagePlugin):
         if len(image.shape) == 2:
             return image
         
-        # Convert to HSV
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV).astype(np.float32)
+        # Neutral settings leave S unchanged, so skip the HSV round trip
+        # (alpha is still dropped, as the HSV path always returns 3 channels)
+        if saturation == 1.0 and vibrance == 0:
+            if image.shape[2] == 4:
+                return cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+            return image
+        
+        # S = 0 maps every pixel to gray at its V = max(B, G, R)
+        if saturation == 0:
+            value = cv2.max(cv2.max(image[:, :, 0], image[:, :, 1]), image[:, :, 2])
+            return cv2.merge([value, value, value])
         
-        # Apply saturation multiplier
-        hsv[:, :, 1] = hsv[:, :, 1] * saturation
+        # Convert to HSV (kept uint8; only the S plane changes)
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
         
-        # Apply vibrance (boost less saturated colors more)
-        if vibrance != 0:
+        if vibrance == 0:
+            # Plain multiply: one saturating scale+cast pass on the S plane
+            hsv[:, :, 1] = cv2.convertScaleAbs(hsv[:, :, 1], alpha=saturation)
+        else:
+            # The new S value depends only on the old one, so evaluate the
+            # adjustment once per level and apply it with cv2.LUT.
+            # Apply saturation multiplier
+            sat = _LUT_X * saturation
+            
+            # Apply vibrance (boost less saturated colors more)
             # Calculate how saturated each pixel is (0-1 range)
-            sat_level = hsv[:, :, 1] / 255.0
+            sat_level = sat / 255.0
             # Less saturated pixels get more boost
             vibrance_factor = 1.0 + (vibrance / 100.0) * (1.0 - sat_level)
-            hsv[:, :, 1] = hsv[:, :, 1] * vibrance_factor
-        
-        # Clip saturation to valid range
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1], 0, 255)
+            sat = sat * vibrance_factor
+            
+            # Clip saturation to valid range, rounding like convertScaleAbs
+            # above so small vibrance values do not jump a level
+            lut = np.clip(np.rint(sat), 0, 255).astype(np.uint8)
+            hsv[:, :, 1] = cv2.LUT(hsv[:, :, 1], lut)
         
         # Convert back to BGR
-        return cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
-
+        return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
 
 plugin = SaturationPlugin()
@@ -3,14 +3,22 @@ Save Batch Images Plugin
 Saves the image to disk at the specified location, ensuring file names are unique (no overwrite).
 """
 import os
+import threading
 from pathlib import Path
+from typing import Dict
 import numpy as np
-import cv2
 
+from app.core.image_writer import (
+    PendingWrites,
+    encode_params,
+    forget_output_dir,
+    output_dir_generation,
+    prepare_for_imwrite,
+    resolve_output_dir,
+)
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
-    BaseParam,
     SelectParam,
     SelectOption,
     StringParam,
@@ -45,6 +53,17 @@ SPEC = PluginSpec(
                 SelectOption(value="jpg", label="JPEG"),
                 SelectOption(value="webp", label="WebP"),
             ]
+        ),
+        SelectParam(
+            name="compression",
+            label="PNG Compression",
+            description="Trade encoding speed for file size (PNG only)",
+            default="fast",
+            options=[
+                SelectOption(value="fast", label="Fast"),
+                SelectOption(value="balanced", label="Balanced"),
+                SelectOption(value="smallest", label="Smallest File"),
+            ]
         )
     ],
 )
@@ -54,12 +73,46 @@ class SaveBatchPlugin(ImagePlugin):
     
     SPEC = SPEC
     
+    def __init__(self):
+        super().__init__()
+        self._writes = PendingWrites()
+        # output_dir -> (its output_dir_generation() at scan time, names in it)
+        self._dir_names: Dict[Path, tuple[int, set[str]]] = {}
+        self._names_lock = threading.Lock()
+    
+    def flush(self) -> None:
+        self._writes.flush()
+    
+    def _existing_names(self, output_dir: Path, rescan: bool = False) -> set[str]:
+        """
+        Names in output_dir, from a single os.scandir instead of one stat per
+        candidate. Scanned on first use, again when rescan is set after a
+        file from elsewhere turned up, and whenever the directory has been
+        re-created since (its old names went with it); otherwise callers
+        keep the set current by adding the names they pick.
+        Call with _names_lock held.
+        """
+        if not output_dir.is_dir():
+            # Deleted since it was resolved: forgetting it also marks the
+            # cached names stale, so the scan below starts from empty
+            forget_output_dir(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        generation = output_dir_generation(output_dir)
+        cached = self._dir_names.get(output_dir)
+        if cached is None or rescan or cached[0] != generation:
+            with os.scandir(output_dir) as entries:
+                cached = (generation, {entry.name for entry in entries})
+            self._dir_names[output_dir] = cached
+        return cached[1]
+    
     def run(self, image: np.ndarray, **kwargs) -> np.ndarray:
         params = self.validate_params(**kwargs)
         
         output_folder_str = params.get("output_folder", "./output")
         prefix = params.get("filename_prefix", "")
         file_format = params.get("format", "png")
+        compression = params.get("compression", "fast")
         
         original_filename = kwargs.get("original_filename")
         if original_filename:
@@ -72,20 +125,8 @@ class SaveBatchPlugin(ImagePlugin):
         else:
             filename_base = base_name
             
-        # Resolve output directory
-        try:
-            target_dir = Path(output_folder_str).resolve()
-            base_output_dir = Path("./output").resolve()
-            
-            if not target_dir.is_absolute():
-                 target_dir = (base_output_dir / output_folder_str).resolve()
-
-            target_dir.mkdir(parents=True, exist_ok=True)
-            output_dir = target_dir
-        except Exception as e:
-            print(f"Error creating directory {output_folder_str}: {e}")
-            output_dir = Path("./output").resolve()
-            output_dir.mkdir(parents=True, exist_ok=True)
+        # Resolve output directory (created once, then cached)
+        output_dir = resolve_output_dir(output_folder_str)
             
         # Collision detection loop
         counter = 0
@@ -94,34 +135,32 @@ class SaveBatchPlugin(ImagePlugin):
         # Try finding a unique name
         # If counter == 0, try "name.png"
         # If exists, try "name_1.png", etc.
-        while True:
-            suffix_str = f"_{counter}" if counter > 0 else ""
-            candidate_name = f"{filename_base}{suffix_str}.{file_format}"
-            candidate_path = output_dir / candidate_name
+        with self._names_lock:
+            existing = self._existing_names(output_dir)
+            while True:
+                suffix_str = f"_{counter}" if counter > 0 else ""
+                candidate_name = f"{filename_base}{suffix_str}.{file_format}"
+                candidate_path = output_dir / candidate_name
+                
+                # Queued writes count as existing files
+                if candidate_name not in existing and candidate_path not in self._writes:
+                    # One stat on the chosen name catches files written by
+                    # someone else since the scan; re-scan and keep looking
+                    if not candidate_path.exists():
+                        final_path = candidate_path
+                        break
+                    existing = self._existing_names(output_dir, rescan=True)
+                    existing.add(candidate_name)
+                counter += 1
             
-            if not candidate_path.exists():
-                final_path = candidate_path
-                break
-            counter += 1
+            # Later images in the batch see this name without re-scanning
+            existing.add(candidate_name)
         
-        # Save image
-        save_image = image.copy()
+        # Bit depth + color order normalization for imwrite
+        save_image = prepare_for_imwrite(image, kwargs.get("color_order", "rgb"))
         
-        # Bit depth normalization
-        if save_image.dtype != np.uint8:
-            if save_image.dtype == np.uint16:
-                save_image = (save_image / 256).astype(np.uint8)
-            elif save_image.dtype in [np.float32, np.float64]:
-                save_image = (save_image * 255).clip(0, 255).astype(np.uint8)
-        
-        # Color space
-        if len(save_image.shape) == 3:
-            if save_image.shape[2] == 3:
-                save_image = cv2.cvtColor(save_image, cv2.COLOR_RGB2BGR)
-            elif save_image.shape[2] == 4:
-                save_image = cv2.cvtColor(save_image, cv2.COLOR_RGBA2BGR)
-                
-        cv2.imwrite(str(final_path), save_image)
+        # Encode + write in the background; flush() waits for completion
+        self._writes.submit(final_path, save_image, encode_params(file_format, compression))
         
         return image
 
@@ -5,12 +5,11 @@ Saves the image to disk at the specified location.
 import os
 from pathlib import Path
 import numpy as np
-import cv2
 
+from app.core.image_writer import PendingWrites, encode_params, prepare_for_imwrite, resolve_output_dir
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
-    BaseParam,
     SelectParam,
     SelectOption,
     StringParam,
@@ -45,6 +44,17 @@ SPEC = PluginSpec(
                 SelectOption(value="jpg", label="JPEG"),
                 SelectOption(value="webp", label="WebP"),
             ]
+        ),
+        SelectParam(
+            name="compression",
+            label="PNG Compression",
+            description="Trade encoding speed for file size (PNG only)",
+            default="fast",
+            options=[
+                SelectOption(value="fast", label="Fast"),
+                SelectOption(value="balanced", label="Balanced"),
+                SelectOption(value="smallest", label="Smallest File"),
+            ]
         )
     ],
 )
@@ -54,12 +64,20 @@ class SaveImagePlugin(ImagePlugin):
     
     SPEC = SPEC
     
+    def __init__(self):
+        super().__init__()
+        self._writes = PendingWrites()
+    
+    def flush(self) -> None:
+        self._writes.flush()
+    
     def run(self, image: np.ndarray, **kwargs) -> np.ndarray:
         params = self.validate_params(**kwargs)
         
         output_path_str = params.get("output_path", "./output")
         filename = params.get("filename", "result")
         file_format = params.get("format", "png")
+        compression = params.get("compression", "fast")
         
         # Batch Support: If we are in a batch context, we might receive the original filename
         # If the user hasn't explicitly set a custom filename (it's still default "result"),
@@ -79,25 +97,8 @@ class SaveImagePlugin(ImagePlugin):
         # 1. Sanitize filename (remove path separators)
         filename = os.path.basename(filename)
             
-        # 2. Resolve output directory
-        base_output_dir = Path("./output").resolve()
-        
-        try:
-            # Allow user to specify a path, but it must be within the allowed areas
-            target_dir = Path(output_path_str).resolve()
-            
-            # Simple sanitization: Create a confined output directory if not absolute
-            if not target_dir.is_absolute():
-                 target_dir = (base_output_dir / output_path_str).resolve()
-
-            # Create directory
-            target_dir.mkdir(parents=True, exist_ok=True)
-            output_dir = target_dir
-
-        except Exception as e:
-            print(f"Error creating directory {output_path_str}: {e}")
-            output_dir = base_output_dir
-            output_dir.mkdir(parents=True, exist_ok=True)
+        # 2. Resolve output directory (created once, then cached)
+        output_dir = resolve_output_dir(output_path_str)
             
         full_path = output_dir / filename
         
@@ -110,7 +111,7 @@ class SaveImagePlugin(ImagePlugin):
         # Let's trust full_path.exists()
         
         final_path = full_path
-        while final_path.exists():
+        while final_path.exists() or final_path in self._writes:
             stem = final_path.stem
             # If stem already looks like name_1, we want name_2?
             # Or just strictly append based on original intent?
@@ -122,24 +123,11 @@ class SaveImagePlugin(ImagePlugin):
             
         full_path = final_path
         
-        # Standard normalization before saving
-        save_image = image.copy()
-        
-        # Ensure it's 8-bit for saving with imwrite
-        if save_image.dtype != np.uint8:
-            if save_image.dtype == np.uint16:
-                save_image = (save_image / 256).astype(np.uint8)
-            elif save_image.dtype in [np.float32, np.float64]:
-                save_image = (save_image * 255).clip(0, 255).astype(np.uint8)
+        # Bit depth + color order normalization for imwrite
+        save_image = prepare_for_imwrite(image, kwargs.get("color_order", "rgb"))
         
-        # Convert RGB to BGR for OpenCV imwrite
-        if len(save_image.shape) == 3:
-            if save_image.shape[2] == 3:
-                save_image = cv2.cvtColor(save_image, cv2.COLOR_RGB2BGR)
-            elif save_image.shape[2] == 4:
-                save_image = cv2.cvtColor(save_image, cv2.COLOR_RGBA2BGR)
-                
-        cv2.imwrite(str(full_path), save_image)
+        # Encode + write in the background; flush() waits for completion
+        self._writes.submit(full_path, save_image, encode_params(file_format, compression))
         
         return image # Return unchanged for further chaining
 
@@ -5,6 +5,7 @@ Adjust shadow and highlight regions independently.
 import numpy as np
 import cv2
 
+from app.core.jit import HAVE_NUMBA, njit, prange
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
@@ -59,6 +60,68 @@ SPEC = PluginSpec(
 )
 
 
+# The 256 uint8 levels, and the same normalized to 0-1, for building LUTs
+_LUT_X = np.arange(256, dtype=np.float32)
+_LUT_X_N01 = _LUT_X / 255.0
+
+
+def _luminance_delta_lut(shadows: float, highlights: float, whites: float) -> np.ndarray:
+    """
+    Per-luminance-level additive shift (in 0-255 units) for the shadows,
+    highlights and whites adjustments, as an int16 table for cv2.LUT.
+    Floored so integer addition matches the float path's truncating cast.
+    """
+    luminance = _LUT_X_N01
+    delta = np.zeros(256, dtype=np.float32)
+    
+    if shadows != 0:
+        delta += np.power(1.0 - luminance, 2) * (shadows / 100.0 * 0.5)
+    if highlights != 0:
+        delta += np.power(luminance, 2) * (highlights / 100.0 * 0.5)
+    if whites != 0:
+        delta += luminance * (whites / 100.0) * 0.3
+    
+    return np.floor(delta * 255.0).astype(np.int16)
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _shadows_highlights_kernel(image, shadow_f, highlight_f, blacks_f, whites_f, out):
+    """
+    Fused uint8 version of the float path: each pixel is read once, all four
+    adjustments are applied in registers and the result is saturated back.
+    image/out are HxWxC with C >= 3 or C = 1 (alpha is copied through).
+    Luma is computed inline in float32 from the first three channels with
+    the BGR2GRAY weights, matching the float path's cvtColor on 0-1 input.
+    """
+    h, w, c = image.shape
+    n_color = 3 if c >= 3 else c
+    for y in prange(h):
+        for x in range(w):
+            if c >= 3:
+                lum = (
+                    np.float32(0.114) * image[y, x, 0]
+                    + np.float32(0.587) * image[y, x, 1]
+                    + np.float32(0.299) * image[y, x, 2]
+                ) / np.float32(255.0)
+            else:
+                lum = image[y, x, 0] / np.float32(255.0)
+            inv_lum = np.float32(1.0) - lum
+            add = inv_lum * inv_lum * shadow_f + lum * lum * highlight_f
+            white_add = lum * whites_f
+            for ch in range(n_color, c):
+                out[y, x, ch] = image[y, x, ch]
+            for ch in range(n_color):
+                v = image[y, x, ch] / np.float32(255.0) + add
+                v += v * inv_lum * blacks_f
+                v = (v + white_add) * np.float32(255.0)
+                if v <= 0:
+                    out[y, x, ch] = 0
+                elif v >= 255:
+                    out[y, x, ch] = 255
+                else:
+                    out[y, x, ch] = np.uint8(v)
+
+
 class ShadowsHighlightsPlugin(ImagePlugin):
     """Shadows and highlights adjustment."""
     
@@ -72,52 +135,93 @@ class ShadowsHighlightsPlugin(ImagePlugin):
         blacks = params.get("blacks", 0.0)
         whites = params.get("whites", 0.0)
         
-        # Work in float, normalized
+        # All sliders at zero: nothing to adjust
+        if image.dtype == np.uint8 and not (shadows or highlights or blacks or whites):
+            return image
+        
+        is_color = len(image.shape) == 3
+        
+        # Without blacks every adjustment is an additive function of luminance
+        # alone, so for uint8 it collapses to a 256-entry delta table
+        if image.dtype == np.uint8 and blacks == 0:
+            lum_u8 = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if is_color else image
+            delta = cv2.LUT(lum_u8, _luminance_delta_lut(shadows, highlights, whites))
+            if is_color:
+                delta = delta[:, :, np.newaxis]
+            # Shift the colour channels only; alpha is copied through
+            color = image[:, :, :3] if is_color else image
+            shifted = np.add(color, delta, dtype=np.int16)
+            np.clip(shifted, 0, 255, out=shifted)
+            if color is image or image.shape[2] == 3:
+                return shifted.astype(np.uint8)
+            result = image.copy()
+            result[:, :, :3] = shifted
+            return result
+        
+        # Blacks depends on the pixel value too; with Numba run it as one fused pass
+        if HAVE_NUMBA and image.dtype == np.uint8:
+            pixels = image if is_color else image[:, :, np.newaxis]
+            out = np.empty_like(pixels)
+            _shadows_highlights_kernel(
+                pixels,
+                np.float32(shadows / 100.0 * 0.5),
+                np.float32(highlights / 100.0 * 0.5),
+                np.float32(blacks / 100.0 * 0.3),
+                np.float32(whites / 100.0 * 0.3),
+                out,
+            )
+            return out if is_color else out[:, :, 0]
+        
+        # Work in float, normalized; only the colour channels are adjusted
         img_float = image.astype(np.float32) / 255.0
+        color = img_float[:, :, :3] if is_color else img_float
         
-        # Get luminance for masking
-        if len(image.shape) == 3:
-            luminance = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY).astype(np.float32) / 255.0
+        # Get luminance for masking, straight from the normalized float image
+        # (no uint8 gray intermediate and no extra cast pass)
+        if is_color:
+            luminance = cv2.cvtColor(img_float, cv2.COLOR_BGR2GRAY)
         else:
             luminance = img_float.copy()
         
-        # Create shadow and highlight masks using smooth curves
-        shadow_mask = np.power(1.0 - luminance, 2)  # Strong in dark areas
-        highlight_mask = np.power(luminance, 2)  # Strong in bright areas
+        # Masks are HxW; broadcast them over the channels so each is read once
+        def per_pixel(mask: np.ndarray) -> np.ndarray:
+            return mask[:, :, np.newaxis] if is_color else mask
+        
+        # Only shadows and blacks need the inverted luminance
+        if shadows != 0 or blacks != 0:
+            inv_luminance = 1.0 - luminance
         
-        # Apply shadows adjustment
+        # Apply shadows adjustment (mask is strong in dark areas)
         if shadows != 0:
+            shadow_mask = np.power(inv_luminance, 2)
             shadow_factor = shadows / 100.0 * 0.5
-            if len(image.shape) == 3:
-                for c in range(3):
-                    img_float[:, :, c] = img_float[:, :, c] + shadow_mask * shadow_factor
-            else:
-                img_float = img_float + shadow_mask * shadow_factor
+            np.multiply(shadow_mask, shadow_factor, out=shadow_mask)
+            np.add(color, per_pixel(shadow_mask), out=color)
         
-        # Apply highlights adjustment
+        # Apply highlights adjustment (mask is strong in bright areas)
         if highlights != 0:
+            highlight_mask = np.power(luminance, 2)
             highlight_factor = highlights / 100.0 * 0.5
-            if len(image.shape) == 3:
-                for c in range(3):
-                    img_float[:, :, c] = img_float[:, :, c] + highlight_mask * highlight_factor
-            else:
-                img_float = img_float + highlight_mask * highlight_factor
+            np.multiply(highlight_mask, highlight_factor, out=highlight_mask)
+            np.add(color, per_pixel(highlight_mask), out=color)
         
         # Apply blacks (shift dark end)
         if blacks != 0:
             blacks_factor = blacks / 100.0
-            img_float = img_float + img_float * (1 - luminance[:, :, np.newaxis] if len(image.shape) == 3 else (1 - luminance)) * blacks_factor * 0.3
+            blacks_add = np.multiply(color, per_pixel(inv_luminance))
+            np.multiply(blacks_add, blacks_factor, out=blacks_add)
+            np.multiply(blacks_add, 0.3, out=blacks_add)
+            np.add(color, blacks_add, out=color)
         
         # Apply whites (shift bright end)
         if whites != 0:
             whites_factor = whites / 100.0
-            if len(image.shape) == 3:
-                img_float = img_float + luminance[:, :, np.newaxis] * whites_factor * 0.3
-            else:
-                img_float = img_float + luminance * whites_factor * 0.3
+            whites_add = np.multiply(luminance, whites_factor)
+            np.multiply(whites_add, 0.3, out=whites_add)
+            np.add(color, per_pixel(whites_add), out=color)
         
         # Clip and convert back
-        return np.clip(img_float * 255.0, 0, 255).astype(np.uint8)
-
+        np.multiply(img_float, 255.0, out=img_float)
+        return np.clip(img_float, 0, 255, out=img_float).astype(np.uint8)
 
 plugin = ShadowsHighlightsPlugin()
@@ -2,6 +2,8 @@
 Sharpen Plugin
 Sharpen images using various methods.
 """
+import threading
+
 import numpy as np
 import cv2
 
@@ -58,6 +60,19 @@ class SharpenPlugin(ImagePlugin):
     
     SPEC = SPEC
     
+    def __init__(self):
+        super().__init__()
+        # Per-thread scratch for the blurred image, reused across calls
+        self._scratch = threading.local()
+    
+    def _blur_buffer(self, image: np.ndarray) -> np.ndarray:
+        """Return a scratch array matching image, reallocated only on shape/dtype change."""
+        buf = getattr(self._scratch, "blur", None)
+        if buf is None or buf.shape != image.shape or buf.dtype != image.dtype:
+            buf = np.empty_like(image)
+            self._scratch.blur = buf
+        return buf
+    
     def run(self, image: np.ndarray, **kwargs) -> np.ndarray:
         params = self.validate_params(**kwargs)
         
@@ -71,12 +86,22 @@ class SharpenPlugin(ImagePlugin):
         if method == "unsharp":
             # Unsharp mask: sharp = original + amount * (original - blurred)
             kernel_size = int(radius * 2) * 2 + 1  # Ensure odd
-            blurred = cv2.GaussianBlur(image, (kernel_size, kernel_size), radius)
+            # A 1x1 Gaussian is the identity, so original - blurred is zero
+            if kernel_size <= 1:
+                return image
+            blurred = cv2.GaussianBlur(
+                image, (kernel_size, kernel_size), radius, dst=self._blur_buffer(image)
+            )
             sharpened = cv2.addWeighted(image, 1 + amount, blurred, -amount, 0)
             return sharpened
             
         elif method == "laplacian":
             # Laplacian sharpening
+            if image.dtype == np.uint8:
+                # The uint8 Laplacian fits in int16; addWeighted combines and
+                # saturates back to uint8 without any float64 buffers
+                laplacian = cv2.Laplacian(image, cv2.CV_16S)
+                return cv2.addWeighted(image, 1.0, laplacian, -amount, 0, dtype=cv2.CV_8U)
             laplacian = cv2.Laplacian(image, cv2.CV_64F)
             sharpened = image.astype(np.float64) - amount * laplacian
             return np.clip(sharpened, 0, 255).astype(np.uint8)
@@ -84,7 +109,12 @@ class SharpenPlugin(ImagePlugin):
         elif method == "highpass":
             # High pass sharpening
             kernel_size = int(radius * 4) * 2 + 1
-            blurred = cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
+            # A 1x1 blur leaves nothing in the high pass
+            if kernel_size <= 1:
+                return image
+            blurred = cv2.GaussianBlur(
+                image, (kernel_size, kernel_size), 0, dst=self._blur_buffer(image)
+            )
             highpass = cv2.subtract(image, blurred)
             sharpened = cv2.addWeighted(image, 1, highpass, amount, 0)
             return sharpened
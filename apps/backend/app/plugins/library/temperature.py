@@ -2,9 +2,13 @@
 Color Temperature Plugin
 Adjust white balance / color temperature.
 """
+import functools
+
 import numpy as np
 import cv2
 
+from app.core.jit import HAVE_NUMBA, njit, prange
+from app.core.opencl import run_with_umat
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
@@ -41,6 +45,46 @@ SPEC = PluginSpec(
 )
 
 
+@functools.lru_cache(maxsize=64)
+def _temperature_lut(temp_factor: float, tint_factor: float) -> np.ndarray:
+    """
+    Build the 3-channel (256, 1, 3) uint8 lookup table applying the B/G/R
+    shifts. Evaluates the same float32 expressions as the float path, so
+    cv2.LUT reproduces it exactly on uint8 input.
+    Cached per parameter pair (callers must not modify the table).
+    """
+    x = np.arange(256, dtype=np.float32)
+    shifts = np.array([-temp_factor, tint_factor, temp_factor], dtype=np.float32)
+    lut = np.clip(x[:, np.newaxis] + shifts, 0, 255).astype(np.uint8)
+    return lut.reshape(256, 1, 3)
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _temperature_kernel(image, temp_factor, tint_factor, out):
+    """
+    Fused float path for any input dtype with C >= 3: shifts B/G/R, clips
+    to 0-255 and truncates to uint8 in one pass (extra channels are only
+    clipped). image and out are HxWxC, out is uint8.
+    """
+    h, w, c = image.shape
+    for y in prange(h):
+        for x in range(w):
+            for ch in range(c):
+                v = np.float32(image[y, x, ch])
+                if ch == 0:
+                    v -= temp_factor
+                elif ch == 1:
+                    v += tint_factor
+                elif ch == 2:
+                    v += temp_factor
+                if v <= 0:
+                    out[y, x, ch] = 0
+                elif v >= 255:
+                    out[y, x, ch] = 255
+                else:
+                    out[y, x, ch] = np.uint8(v)
+
+
 class TemperaturePlugin(ImagePlugin):
     """Color temperature and tint adjustment."""
     
@@ -56,21 +100,37 @@ class TemperaturePlugin(ImagePlugin):
         if len(image.shape) == 2:
             return image
         
-        # Work in float
-        img_float = image.astype(np.float32)
-        
         # Temperature: adjust blue and red channels
         # Warm = more red, less blue
         # Cool = more blue, less red
         temp_factor = temperature / 100.0 * 50  # Scale to reasonable shift
         
-        img_float[:, :, 0] = img_float[:, :, 0] - temp_factor  # Blue channel
-        img_float[:, :, 2] = img_float[:, :, 2] + temp_factor  # Red channel
-        
         # Tint: adjust green channel
         # Magenta = less green
         # Green = more green
         tint_factor = -tint / 100.0 * 30  # Scale to reasonable shift
+        
+        # Neutral sliders leave uint8 data untouched
+        if temp_factor == 0 and tint_factor == 0 and image.dtype == np.uint8:
+            return image
+        
+        # Each channel shift depends only on that channel's value, so uint8
+        # BGR collapses to a single 3-channel cv2.LUT pass
+        if image.dtype == np.uint8 and image.shape[2] == 3:
+            lut = _temperature_lut(temp_factor, tint_factor)
+            return run_with_umat(lambda img: cv2.LUT(img, lut), image)
+        
+        # Other inputs (e.g. uint16/float, BGRA): one fused pass with Numba
+        if HAVE_NUMBA:
+            out = np.empty(image.shape, dtype=np.uint8)
+            _temperature_kernel(image, np.float32(temp_factor), np.float32(tint_factor), out)
+            return out
+        
+        # Work in float
+        img_float = image.astype(np.float32)
+        
+        img_float[:, :, 0] = img_float[:, :, 0] - temp_factor  # Blue channel
+        img_float[:, :, 2] = img_float[:, :, 2] + temp_factor  # Red channel
         img_float[:, :, 1] = img_float[:, :, 1] + tint_factor  # Green channel
         
         # Clip and convert
@@ -2,8 +2,15 @@
 Unsharp Mask Plugin
 Enhances edges by subtracting a blurred version from the original.
 """
+import functools
+import threading
+from typing import Callable, Optional
+
 import numpy as np
 import cv2
+
+from app.core.jit import HAVE_NUMBA, njit, prange
+from app.core.opencl import USE_UMAT, run_with_umat
 from app.core.plugin_spec import (
     ImagePlugin,
     PluginSpec,
@@ -49,11 +56,118 @@ SPEC = PluginSpec(
 )
 
 
+# Scratch arrays kept per thread before the set is dropped
+SCRATCH_BUFFERS = 8
+
+# (role, like-array) -> reusable array of the same shape/dtype
+ScratchFn = Callable[[str, np.ndarray], np.ndarray]
+
+
+@functools.lru_cache(maxsize=64)
+def _gaussian_kernel(sigma: float, is_uint8: bool) -> np.ndarray:
+    """
+    1-D Gaussian kernel sized the way cv2.GaussianBlur does for ksize=(0, 0)
+    (3 sigma per side for uint8, 4 sigma otherwise).
+    Cached per sigma (callers must not modify the kernel).
+    """
+    ksize = int(round(sigma * (3 if is_uint8 else 4) * 2 + 1)) | 1
+    return cv2.getGaussianKernel(ksize, sigma, cv2.CV_32F)
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _unsharp_threshold_kernel(image, blurred, strength, threshold, out):
+    """
+    Thresholded unsharp mask for uint8 HxWxC arrays in one pass: pixels whose
+    |original - blurred| is below threshold are copied, the rest sharpened
+    and saturated (rounded like cv2.addWeighted).
+    """
+    h, w, c = image.shape
+    for y in prange(h):
+        for x in range(w):
+            for ch in range(c):
+                a = np.float32(image[y, x, ch])
+                d = a - np.float32(blurred[y, x, ch])
+                if abs(d) < threshold:
+                    out[y, x, ch] = image[y, x, ch]
+                    continue
+                v = a + strength * d
+                if v <= 0:
+                    out[y, x, ch] = 0
+                elif v >= 255:
+                    out[y, x, ch] = 255
+                else:
+                    out[y, x, ch] = np.uint8(np.rint(v))
+
+
+def _unsharp(image, kernel: np.ndarray, strength: float, threshold: int, scratch: Optional[ScratchFn] = None):
+    """
+    Unsharp-mask an image and return the result.
+    Outside the Numba branch only OpenCV calls are used, so image may be a
+    cv2.UMat.
+    scratch, if given, supplies reusable arrays for the intermediates.
+    """
+    # Gaussian blur as two 1-D passes with the (cached) kernel
+    blurred = cv2.sepFilter2D(
+        image, -1, kernel, kernel, dst=scratch("blur", image) if scratch else None
+    )
+    
+    # Threshold on uint8 with Numba: decide and sharpen in a single pass
+    if threshold > 0 and HAVE_NUMBA and isinstance(image, np.ndarray) and image.dtype == np.uint8:
+        pixels = image if image.ndim == 3 else image[:, :, np.newaxis]
+        out = np.empty_like(pixels)
+        _unsharp_threshold_kernel(
+            pixels,
+            blurred if blurred.ndim == 3 else blurred[:, :, np.newaxis],
+            np.float32(strength),
+            np.float32(threshold),
+            out,
+        )
+        return out if image.ndim == 3 else out[:, :, 0]
+    
+    # original + strength * (original - blurred) with OpenCV's fused,
+    # saturating multiply-add (output keeps the input dtype)
+    sharpened = cv2.addWeighted(image, 1.0 + strength, blurred, -strength, 0)
+    
+    # Calculate comparison mask if threshold > 0
+    if threshold > 0:
+        diff = cv2.absdiff(image, blurred, dst=scratch("diff", image) if scratch else None)
+        # uint8 mask (255 = keep original) wherever the change is below the
+        # threshold; for uint8 input it can reuse diff's shape/dtype scratch
+        keep = cv2.compare(
+            diff,
+            threshold,
+            cv2.CMP_LT,
+            dst=scratch("keep", diff) if scratch and image.dtype == np.uint8 else None,
+        )
+        cv2.copyTo(image, keep, sharpened)
+    
+    return sharpened
+
+
 class UnsharpMaskPlugin(ImagePlugin):
     """Unsharp Mask implementation."""
     
     SPEC = SPEC
     
+    def __init__(self):
+        super().__init__()
+        # Per-thread scratch for the blurred image and the threshold diff,
+        # reused across calls
+        self._scratch = threading.local()
+    
+    def _scratch_like(self, role: str, image: np.ndarray) -> np.ndarray:
+        """Return this thread's scratch array for role, shaped like image."""
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = {}
+        key = (role, image.shape, image.dtype)
+        buf = buffers.get(key)
+        if buf is None:
+            if len(buffers) >= SCRATCH_BUFFERS:
+                buffers.clear()
+            buf = buffers[key] = np.empty_like(image)
+        return buf
+    
     def run(self, image: np.ndarray, **kwargs) -> np.ndarray:
         params = self.validate_params(**kwargs)
         
@@ -61,38 +175,18 @@ class UnsharpMaskPlugin(ImagePlugin):
         radius = params.get("radius", 1.0)
         threshold = params.get("threshold", 0)
         
-        # Create Gaussian blur
-        # Kernel size usually derived from radius (sigma). 
-        # OpenCV uses sigmaX=radius. Kernel size (0,0) lets OpenCV compute it.
-        blurred = cv2.GaussianBlur(image, (0, 0), radius)
-        
-        # Convert to float for calculation
-        img_f = image.astype(np.float32)
-        blur_f = blurred.astype(np.float32)
-        
-        # Calculate comparison mask if threshold > 0
-        if threshold > 0:
-            diff = np.abs(img_f - blur_f)
-            mask = diff >= threshold
-            
-            sharpened = np.zeros_like(img_f)
-            # Apply sharpening only where diff > threshold
-            sharpened[mask] = img_f[mask] + strength * (img_f[mask] - blur_f[mask])
-            # Keep original elsewhere
-            sharpened[~mask] = img_f[~mask]
-        else:
-            sharpened = img_f + strength * (img_f - blur_f)
+        # Nothing to add: zero strength, or no uint8 difference can reach the threshold
+        if strength == 0 or (image.dtype == np.uint8 and threshold > 255):
+            return image
         
-        # Safe cast
-        sharpened = np.nan_to_num(sharpened, nan=0.0, posinf=255.0, neginf=0.0)
+        # Blur kernel of the size OpenCV picks for sigma=radius, ksize=(0,0)
+        kernel = _gaussian_kernel(float(radius), image.dtype == np.uint8)
         
-        # Clip to valid range and convert back
-        if image.dtype == np.uint8:
-            sharpened = np.clip(sharpened, 0, 255).astype(np.uint8)
-        elif image.dtype == np.uint16:
-             sharpened = np.clip(sharpened, 0, 65535).astype(np.uint16)
+        # The blur/combine/mask sequence is OpenCV-only: run it on the GPU
+        if USE_UMAT:
+            return run_with_umat(lambda img: _unsharp(img, kernel, strength, threshold), image)
         
-        return sharpened
+        return _unsharp(image, kernel, strength, threshold, self._scratch_like)
 
 
 plugin = UnsharpMaskPlugin()
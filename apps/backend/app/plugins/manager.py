@@ -34,52 +34,92 @@ class PluginManager:
         self._plugins: Dict[str, ImagePlugin] = {}
         self._specs: Dict[str, PluginSpec] = {}
         self._library_path = Path(__file__).parent / "library"
+        # plugin file -> (st_mtime_ns, SPEC, plugin) from its last import
+        self._module_cache: Dict[Path, tuple[int, PluginSpec, ImagePlugin]] = {}
+        # Built on first get_specs_by_category() call after each discovery
+        self._categories: Optional[Dict[str, list[PluginSpec]]] = None
+    
+    def _load_plugin_module(
+        self,
+        plugin_file: Path,
+        module_cache: Dict[Path, tuple[int, PluginSpec, ImagePlugin]],
+    ) -> Optional[tuple[int, PluginSpec, ImagePlugin]]:
+        """
+        Import one plugin file (or reuse module_cache if its mtime is unchanged).
+        Returns (mtime, SPEC, plugin), or None if the file is not a valid plugin.
+        """
+        try:
+            mtime = plugin_file.stat().st_mtime_ns
+            cached = module_cache.get(plugin_file)
+            
+            if cached is not None and cached[0] == mtime:
+                return cached
+            
+            # Import the module dynamically
+            module_name = f"app.plugins.library.{plugin_file.stem}"
+            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+            
+            if spec is None or spec.loader is None:
+                return None
+                
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            
+            # Check for required exports
+            if not hasattr(module, "SPEC") or not hasattr(module, "plugin"):
+                print(f"Warning: {plugin_file.name} missing SPEC or plugin exports")
+                return None
+            
+            return mtime, module.SPEC, module.plugin
+            
+        except Exception as e:
+            print(f"Error loading plugin {plugin_file.name}: {e}")
+            return None
     
     def discover_plugins(self) -> int:
         """
         Scan the library directory and load all valid plugins.
+        Files are loaded in sorted order. Modules unchanged since the previous
+        scan (same mtime) are not re-executed; their SPEC and plugin
+        instance are reused.
         Returns the number of plugins loaded.
         """
         self._plugins.clear()
         self._specs.clear()
+        self._categories = None
         
         if not self._library_path.exists():
             return 0
         
+        # Skip __init__.py etc.
+        plugin_files = sorted(
+            f for f in self._library_path.glob("*.py") if not f.name.startswith("_")
+        )
+        
+        module_cache = self._module_cache
+        self._module_cache = {}
+        
         count = 0
-        for plugin_file in self._library_path.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue  # Skip __init__.py etc.
+        for plugin_file in plugin_files:
+            result = self._load_plugin_module(plugin_file, module_cache)
+            if result is None:
+                continue
             
-            try:
-                # Import the module dynamically
-                module_name = f"app.plugins.library.{plugin_file.stem}"
-                spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-                
-                if spec is None or spec.loader is None:
-                    continue
-                    
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                # Check for required exports
-                if not hasattr(module, "SPEC") or not hasattr(module, "plugin"):
-                    print(f"Warning: {plugin_file.name} missing SPEC or plugin exports")
-                    continue
-                
-                plugin_spec: PluginSpec = module.SPEC
-                plugin_instance: ImagePlugin = module.plugin
-                
-                # Register the plugin
-                self._specs[plugin_spec.name] = plugin_spec
-                self._plugins[plugin_spec.name] = plugin_instance
-                
-                print(f"Loaded plugin: {plugin_spec.display_name} ({plugin_spec.name})")
-                count += 1
-                
-            except Exception as e:
-                print(f"Error loading plugin {plugin_file.name}: {e}")
+            self._module_cache[plugin_file] = result
+            _, plugin_spec, plugin_instance = result
+            
+            # Plugins are keyed by SPEC.name; never let a second module
+            # silently replace an already registered plugin
+            if plugin_spec.name in self._specs:
+                print(f"Warning: {plugin_file.name} redefines plugin '{plugin_spec.name}', skipping")
                 continue
+            
+            # Register the plugin
+            self._specs[plugin_spec.name] = plugin_spec
+            self._plugins[plugin_spec.name] = plugin_instance
+            
+            print(f"Loaded plugin: {plugin_spec.display_name} ({plugin_spec.name})")
+            count += 1
         
         return count
     
@@ -88,7 +128,14 @@ class PluginManager:
         return list(self._specs.values())
     
     def get_specs_by_category(self) -> Dict[str, list[PluginSpec]]:
-        """Return plugins grouped by category."""
+        """
+        Return plugins grouped by category.
+        The index is cached until the next discover_plugins(); callers must
+        not modify the returned dict or lists.
+        """
+        if self._categories is not None:
+            return self._categories
+        
         categories: Dict[str, list[PluginSpec]] = {}
         
         for spec in self._specs.values():
@@ -96,6 +143,7 @@ class PluginManager:
                 categories[spec.category] = []
             categories[spec.category].append(spec)
         
+        self._categories = categories
         return categories
     
     def get_spec(self, plugin_name: str) -> Optional[PluginSpec]:
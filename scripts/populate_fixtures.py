@@ -1,4 +1,5 @@
 
+import asyncio
 import os
 import httpx
 import numpy as np
@@ -33,7 +34,10 @@ def create_test_images():
     cv2.putText(img_portrait_raw, "Portrait if Rotated", (50, 200), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
     
     # Save as JPG with EXIF
-    pil_img = Image.fromarray(cv2.cvtColor(img_portrait_raw, cv2.COLOR_BGR2RGB))
+    # PIL's raw "BGR" decoder swaps channels while reading the buffer, so no
+    # RGB copy of the array is made first
+    h, w = img_portrait_raw.shape[:2]
+    pil_img = Image.frombuffer("RGB", (w, h), img_portrait_raw, "raw", "BGR", 0, 1)
     
     # EXIF tag 0x0112 is Orientation. Value 6 is "Rotate 90 CW".
     # Value 8 is "Rotate 270 CW" (90 CCW).
@@ -43,7 +47,10 @@ def create_test_images():
     pil_img.save(str(FIXTURES_DIR / "portrait_exif.jpg"), exif=exif)
 
     # 3. Noise A (for comparison)
-    img_a = np.random.randint(0, 255, (512, 512, 3), dtype=np.uint8)
+    # Seeded PCG64 generator: faster than the legacy RandomState and keeps the
+    # fixtures identical between runs
+    rng = np.random.default_rng(seed=42)
+    img_a = rng.integers(0, 255, (512, 512, 3), dtype=np.uint8)
     cv2.imwrite(str(FIXTURES_DIR / "noise_a.png"), img_a)
 
     # 4. Noise B (Blurred A)
@@ -52,22 +59,31 @@ def create_test_images():
     
     print("Test images generated.")
 
+async def _upload_one(client, file_path):
+    with open(file_path, "rb") as f:
+        files = {"file": (file_path.name, f.read())}
+    try:
+        response = await client.post(API_URL, files=files)
+        if response.status_code == 200:
+            data = response.json()
+            print(f"Uploaded {file_path.name}: ID={data['id']}")
+        else:
+            print(f"Failed to upload {file_path.name}: {response.text}")
+    except Exception as e:
+        print(f"Error uploading {file_path.name}: {e}")
+
+async def _upload_all():
+    # One client; all uploads in flight together instead of one RTT each
+    async with httpx.AsyncClient(timeout=30) as client:
+        await asyncio.gather(*[
+            _upload_one(client, file_path)
+            for file_path in FIXTURES_DIR.glob("*")
+            if not file_path.name.startswith(".")
+        ])
+
 def upload_images():
     print("Uploading images to backend...")
-    for file_path in FIXTURES_DIR.glob("*"):
-        if file_path.name.startswith("."): continue
-        
-        with open(file_path, "rb") as f:
-            files = {"file": f}
-            try:
-                response = httpx.post(API_URL, files=files)
-                if response.status_code == 200:
-                    data = response.json()
-                    print(f"Uploaded {file_path.name}: ID={data['id']}")
-                else:
-                    print(f"Failed to upload {file_path.name}: {response.text}")
-            except Exception as e:
-                print(f"Error uploading {file_path.name}: {e}")
+    asyncio.run(_upload_all())
 
 if __name__ == "__main__":
     create_fixtures_dir()